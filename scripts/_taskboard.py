@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""
+_taskboard
+record-*.py 共用的 task-board.json 读写助手
+
+Single home for the board path, the mtime read-through cache, the
+atomic save, and task construction — so the record scripts stay a
+TODAY_TASKS list plus a short main().
+"""
+
+import json
+import os
+from datetime import datetime
+from pathlib import Path
+
+WORKSPACE = Path.home() / ".openclaw" / "workspace"
+TASKS_FILE = WORKSPACE / "task-board.json"
+
+# Optional fast JSON path, same shim as quick-task-panel/port-manager.
+# 默认写紧凑 JSON（大板子省时省字节）；PRETTY=1 时才排缩进给人看
+try:
+    import orjson
+
+    _loads = orjson.loads
+
+    def _dumps(obj, pretty=False):
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if pretty else 0)
+except ImportError:
+    _loads = json.loads
+
+    def _dumps(obj, pretty=False):
+        if pretty:
+            return json.dumps(obj, ensure_ascii=False,
+                              indent=2).encode("utf-8")
+        return json.dumps(obj, ensure_ascii=False,
+                          separators=(",", ":")).encode("utf-8")
+
+
+# Read-through cache keyed on the board file's mtime: repeat
+# load_tasks calls in one run skip the re-parse entirely
+_CACHE = {"mtime": None, "data": None}
+
+_workspace_ready = False
+
+
+def _ensure_workspace():
+    # One mkdir syscall per process, not one per save
+    global _workspace_ready
+    if not _workspace_ready:
+        WORKSPACE.mkdir(parents=True, exist_ok=True)
+        _workspace_ready = True
+
+
+def load_tasks():
+    try:
+        st = TASKS_FILE.stat()
+    except FileNotFoundError:
+        return []
+    if _CACHE["mtime"] == st.st_mtime_ns:
+        return list(_CACHE["data"])
+    tasks = _loads(TASKS_FILE.read_bytes())
+    _CACHE["mtime"] = st.st_mtime_ns
+    _CACHE["data"] = tasks
+    # Hand out a shallow copy so callers can't mutate the cache's list
+    return list(tasks)
+
+
+def save_tasks(tasks):
+    # Write to a temp file and rename: a crash mid-write can never
+    # leave a truncated board behind
+    _ensure_workspace()
+    tmp = TASKS_FILE.with_suffix(".json.tmp")
+    tmp.write_bytes(_dumps(tasks, pretty=bool(os.environ.get("PRETTY"))))
+    os.replace(tmp, TASKS_FILE)
+    _CACHE["mtime"] = TASKS_FILE.stat().st_mtime_ns
+    _CACHE["data"] = tasks
+
+
+def next_task_id(tasks):
+    """Seed an id counter off the current board, once per batch."""
+    return max((t.get("id", 0) for t in tasks), default=0) + 1
+
+
+def _build_task(title, category, ts, id_):
+    # One timestamp string for both fields — format once, reuse
+    return {
+        "id": id_,
+        "title": title,
+        "status": "todo",
+        "category": category,
+        "created_at": ts,
+        "updated_at": ts,
+    }
+
+
+def add_task_inplace(tasks, title, category="misc", now=None, id_=None):
+    """Append one task to an in-memory list; no disk I/O."""
+    task = _build_task(title, category,
+                       now or datetime.now().isoformat(),
+                       id_ if id_ is not None else next_task_id(tasks))
+    tasks.append(task)
+    return task
+
+
+def batch_add(tasks, configs):
+    """Append many tasks with one timestamp snapshot and one id seed.
+
+    Takes datetime.now() once for the whole batch instead of per task,
+    hands out ids from a counter so the max() scan runs once, and
+    extends the board in a single resize rather than append-by-append.
+    """
+    now = datetime.now().isoformat()
+    id_ = next_task_id(tasks)
+    added = [
+        _build_task(cfg["title"], cfg.get("category", "misc"), now, id_ + i)
+        for i, cfg in enumerate(configs)
+    ]
+    tasks.extend(added)
+    return added
+
+
+def add_task(title, category="misc"):
+    """Legacy single-task entry point: one load, one save."""
+    tasks = load_tasks()
+    task = add_task_inplace(tasks, title, category)
+    save_tasks(tasks)
+    return task
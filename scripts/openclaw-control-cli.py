@@ -42,8 +42,9 @@ def save_config(config: Dict[str, Any], backup: bool = True):
             shutil.copy(CONFIG_FILE, backup_file)
     
     with open(CONFIG_FILE, "w", encoding="utf-8") as f:
-        json.dump(config, f, indent=2, ensure_ascii=False)
-        f.write("\n")
+        # Encode once in memory and emit a single write instead of
+        # letting json.dump stream token-by-token
+        f.write(json.dumps(config, indent=2, ensure_ascii=False) + "\n")
     
     print(f"✅ Configuration saved to {CONFIG_FILE}")
     print("ℹ️  Restart QClaw app to apply changes")
@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""
+optimize-skills
+Stamp workspace skills with their GitHub source
+
+Adds a `github_source:` line to the YAML frontmatter of every
+skills/<name>/SKILL.md so installed copies can be traced back to this
+repo, then records a session-context snapshot under memory/.
+"""
+
+import json
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+SKILLS_DIR = REPO_ROOT / "skills"
+MEMORY_DIR = REPO_ROOT / "memory"
+GITHUB_BASE = "https://github.com/Feahter/openclaw-tools/tree/main/skills"
+
+
+def add_github_source(skill_name: str, github_source: str) -> bool:
+    """Append github_source to the SKILL.md frontmatter.
+
+    Reentrant: touches only its own skill file, no shared state, so it is
+    safe to run from the thread pool in main().
+    """
+    skill_path = SKILLS_DIR / skill_name / "SKILL.md"
+    if not skill_path.is_file():
+        return False
+
+    text = skill_path.read_text(encoding="utf-8")
+    if "github_source:" in text:
+        return True
+
+    # Splice the new line in before the closing --- instead of
+    # split/join, which allocates a copy of every section
+    end = text.find("---", 3)
+    if end == -1:
+        # No frontmatter yet, create a minimal one
+        text = f"---\nname: {skill_name}\ngithub_source: {github_source}\n---\n" + text
+    else:
+        text = text[:end].rstrip() + f"\ngithub_source: {github_source}\n" + text[end:]
+
+    skill_path.write_text(text, encoding="utf-8")
+    return True
+
+
+def save_session_context(updated):
+    """记录本次更新的 session context 到 memory/"""
+    MEMORY_DIR.mkdir(exist_ok=True)
+    now = datetime.now()
+    ts = now.isoformat()
+    context = {
+        "session": "optimize-skills",
+        "date": ts,
+        "updated_at": ts,
+        "skills_updated": updated,
+    }
+    out = MEMORY_DIR / f"session-{now.strftime('%Y%m%d')}.json"
+    out.write_text(json.dumps(context, indent=2, ensure_ascii=False), encoding="utf-8")
+    return out
+
+
+def main():
+    workspace_skills_github = {
+        d.name: f"{GITHUB_BASE}/{d.name}"
+        for d in sorted(SKILLS_DIR.iterdir())
+        if (d / "SKILL.md").is_file()
+    }
+
+    # SKILL.md edits are independent and IO-bound: run them in parallel
+    with ThreadPoolExecutor(max_workers=8) as ex:
+        results = list(ex.map(lambda kv: add_github_source(*kv),
+                              workspace_skills_github.items()))
+
+    updated = [name for name, ok in zip(workspace_skills_github, results) if ok]
+    save_session_context(updated)
+    print(f"✅ Stamped {len(updated)}/{len(workspace_skills_github)} skills with github_source")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,320 @@
+#!/usr/bin/env python3
+"""
+port-manager
+Port allocation and lifecycle management for locally launched tools
+
+Tools get ports from the reserved 8760-8799 range; allocations are
+persisted to ~/.openclaw/workspace/.state/port-allocations.json so
+separate invocations do not hand out the same port twice.
+"""
+
+import atexit
+import json
+import os
+import select
+import signal
+import subprocess
+import sys
+import time
+import socket
+from pathlib import Path
+
+RESERVED_START = 8760
+RESERVED_END = 8799
+
+STATE_DIR = Path.home() / ".openclaw" / "workspace" / ".state"
+PORT_FILE = STATE_DIR / "port-allocations.json"
+
+# Optional fast JSON path, same shim as quick-task-panel
+try:
+    import orjson
+
+    _loads = orjson.loads
+
+    def _dumps(obj):
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+except ImportError:
+    _loads = json.loads
+
+    def _dumps(obj):
+        return json.dumps(obj, indent=2).encode("utf-8")
+
+
+class PortManager:
+    """管理工具端口分配与进程生命周期"""
+
+    def __init__(self):
+        self.locked_ports = self.load_locks()
+        self._dirty = False
+        atexit.register(self._flush_locks)
+
+    # ── persistence ──────────────────────────────────────────────
+
+    def load_locks(self):
+        if PORT_FILE.exists():
+            try:
+                return _loads(PORT_FILE.read_bytes())
+            except ValueError:
+                return {}
+        return {}
+
+    def _flush_locks(self):
+        """Write allocations back out, once, if anything changed.
+
+        Mutations only mark the in-memory dict dirty; the liveness sweep
+        and the file rewrite happen here (at exit, or explicitly), and
+        the write goes through a temp file + os.replace so readers never
+        see a partial file.
+        """
+        if not self._dirty:
+            return
+        # Drop entries whose process has gone away
+        self.locked_ports = {
+            name: entry for name, entry in self.locked_ports.items()
+            if self.is_process_alive(entry.get("pid"))
+        }
+        STATE_DIR.mkdir(parents=True, exist_ok=True)
+        tmp = PORT_FILE.with_suffix(".tmp")
+        tmp.write_bytes(_dumps(self.locked_ports))
+        os.replace(tmp, PORT_FILE)
+        self._dirty = False
+
+    # ── probes ───────────────────────────────────────────────────
+
+    @staticmethod
+    def is_process_alive(pid):
+        if not pid:
+            return False
+        try:
+            os.kill(pid, 0)
+            return True
+        except (OSError, ProcessLookupError):
+            return False
+
+    @staticmethod
+    def is_port_available(port):
+        # SO_REUSEADDR keeps TIME_WAIT leftovers from reading as "in
+        # use", and the wildcard bind catches listeners on 0.0.0.0/::
+        # that a 127.0.0.1-only bind would miss
+        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
+            s.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+            try:
+                s.bind(("", port))
+            except OSError:
+                return False
+        try:
+            socket.create_connection(("127.0.0.1", port), timeout=0.05).close()
+            return False  # something answered: port is actually in use
+        except OSError:
+            return True
+
+    @staticmethod
+    def _listening_ports():
+        """Collect locally listening TCP ports in one pass.
+
+        On Linux this is a single read of /proc/net/tcp{,6} (state 0A is
+        LISTEN); elsewhere fall back to psutil if installed, or an empty
+        set, which just means the caller does a bind probe per candidate.
+        """
+        ports = set()
+        for proc_file in ("/proc/net/tcp", "/proc/net/tcp6"):
+            try:
+                lines = open(proc_file).read().splitlines()[1:]
+            except OSError:
+                continue
+            for line in lines:
+                cols = line.split()
+                if len(cols) > 3 and cols[3] == "0A":
+                    ports.add(int(cols[1].rsplit(":", 1)[1], 16))
+        if ports:
+            return ports
+        try:
+            import psutil
+            for conn in psutil.net_connections(kind="inet"):
+                if conn.status == "LISTEN":
+                    ports.add(conn.laddr.port)
+        except ImportError:
+            pass
+        return ports
+
+    @staticmethod
+    def _scan_available(ports):
+        """Bind-probe candidate ports reusing one socket.
+
+        A failed bind leaves the socket unbound and reusable, so the
+        whole scan costs a single fd allocation instead of one per
+        candidate; only a successful bind consumes the socket.
+        """
+        s = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        s.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        try:
+            for port in ports:
+                try:
+                    s.bind(("", port))
+                    return port
+                except OSError:
+                    continue
+            return None
+        finally:
+            s.close()
+
+    def find_available_port(self):
+        """Pick the lowest free reserved port with one scan + one probe."""
+        locked = {entry.get("port") for entry in self.locked_ports.values()}
+        candidates = (set(range(RESERVED_START, RESERVED_END + 1))
+                      - locked - self._listening_ports())
+        port = self._scan_available(sorted(candidates))
+        if port is not None:
+            return port
+        raise RuntimeError(
+            f"No free port in {RESERVED_START}-{RESERVED_END}")
+
+    # ── lifecycle ────────────────────────────────────────────────
+
+    def lock_port(self, name, port, pid=None):
+        self.locked_ports[name] = {
+            "port": port, "pid": pid, "locked_at": time.time()}
+        self._dirty = True
+
+    def unlock_port(self, name):
+        if self.locked_ports.pop(name, None) is not None:
+            self._dirty = True
+
+    def register_process(self, name, pid):
+        if name in self.locked_ports:
+            self.locked_ports[name]["pid"] = pid
+            self._dirty = True
+
+    def kill_process(self, pid):
+        """SIGTERM, give the process up to 1s to exit, then SIGKILL."""
+        try:
+            os.kill(pid, signal.SIGTERM)
+        except (OSError, ProcessLookupError):
+            return
+        if not self._wait_for_exit(pid, 1.0):
+            try:
+                os.kill(pid, signal.SIGKILL)
+            except (OSError, ProcessLookupError):
+                pass
+
+    def _wait_for_exit(self, pid, timeout):
+        """Block until pid exits or timeout; True if it exited.
+
+        On Linux >=5.3 a pidfd lets us sleep in poll() and wake the
+        moment the process dies; elsewhere (or for non-child pids the
+        kernel refuses) fall back to the 100ms polling loop.
+        """
+        try:
+            fd = os.pidfd_open(pid)
+        except (AttributeError, OSError):
+            deadline = time.monotonic() + timeout
+            while time.monotonic() < deadline:
+                if not self.is_process_alive(pid):
+                    return True
+                time.sleep(0.1)
+            return not self.is_process_alive(pid)
+        try:
+            poller = select.poll()
+            poller.register(fd, select.POLLIN)
+            return bool(poller.poll(int(timeout * 1000)))
+        finally:
+            os.close(fd)
+
+    def start_tool(self, name, command):
+        """启动工具并等待其 HTTP 端口就绪"""
+        port = self.find_available_port()
+        env = dict(os.environ, PORT=str(port))
+        proc = subprocess.Popen(
+            command, shell=True, env=env,
+            stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        self.lock_port(name, port, proc.pid)
+
+        # Watch the child's pidfd while waiting so a crash-on-startup
+        # fails immediately instead of burning the whole 30s timeout
+        poller = None
+        pidfd = None
+        try:
+            pidfd = os.pidfd_open(proc.pid)
+            poller = select.poll()
+            poller.register(pidfd, select.POLLIN)
+        except (AttributeError, OSError):
+            pass
+
+        try:
+            # TCP connect probe with fast exponential back-off: median
+            # readiness lands in ~100ms instead of the old 1s quantum
+            deadline = time.monotonic() + 30
+            backoff = 0.05
+            while time.monotonic() < deadline:
+                try:
+                    socket.create_connection(("127.0.0.1", port),
+                                             timeout=0.1).close()
+                    print(f"✅ {name} ready on port {port} (pid {proc.pid})")
+                    return port
+                except OSError:
+                    pass
+                if poller is not None:
+                    if poller.poll(int(backoff * 1000)):
+                        proc.wait()
+                        self.unlock_port(name)
+                        print(f"❌ {name} exited during startup "
+                              f"(code {proc.returncode})")
+                        return None
+                else:
+                    time.sleep(backoff)
+                    if proc.poll() is not None:
+                        self.unlock_port(name)
+                        print(f"❌ {name} exited during startup "
+                              f"(code {proc.returncode})")
+                        return None
+                backoff = min(backoff * 1.5, 0.5)
+            print(f"⚠️  {name} started (pid {proc.pid}) but port {port} never came up")
+            return port
+        finally:
+            if pidfd is not None:
+                os.close(pidfd)
+
+    def stop_tool(self, name):
+        entry = self.locked_ports.get(name)
+        if not entry:
+            print(f"ℹ️  {name} is not running")
+            return
+        if entry.get("pid"):
+            self.kill_process(entry["pid"])
+        self.unlock_port(name)
+        print(f"✅ Stopped {name}")
+
+    def stop_all(self):
+        for name in list(self.locked_ports):
+            self.stop_tool(name)
+
+    def status(self):
+        if not self.locked_ports:
+            print("ℹ️  No ports allocated")
+            return
+        for name, entry in self.locked_ports.items():
+            alive = "✅" if self.is_process_alive(entry.get("pid")) else "❌"
+            print(f"  {alive} {name}: port {entry.get('port')} "
+                  f"(pid {entry.get('pid')})")
+
+
+def main():
+    mgr = PortManager()
+    args = sys.argv[1:]
+    if not args or args[0] == "status":
+        mgr.status()
+    elif args[0] == "start" and len(args) >= 3:
+        mgr.start_tool(args[1], " ".join(args[2:]))
+    elif args[0] == "stop" and len(args) == 2:
+        mgr.stop_tool(args[1])
+    elif args[0] == "stop-all":
+        mgr.stop_all()
+    elif args[0] == "find":
+        print(mgr.find_available_port())
+    else:
+        print("Usage: port-manager.py [status|find|start <name> <cmd>|stop <name>|stop-all]")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
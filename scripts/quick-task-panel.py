@@ -0,0 +1,393 @@
+#!/usr/bin/env python3
+"""
+quick-task-panel
+本地任务看板：浏览器里看/挪 task-board.json 的三列面板
+
+Serves a small single-page board on port 8765; the page polls
+/api/tasks every 15s and posts moves back.
+"""
+
+import gzip
+import json
+import os
+import signal
+import socket
+import threading
+import time
+import webbrowser
+
+try:
+    import fcntl
+except ImportError:  # Windows: single process, no flock needed
+    fcntl = None
+from datetime import datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+PORT = 8765
+WORKSPACE = Path.home() / ".openclaw" / "workspace"
+TASKS_FILE = WORKSPACE / "task-board.json"
+
+# orjson is ~5-10x faster than stdlib json on this file; fall back
+# silently when it isn't installed
+try:
+    import orjson
+
+    _loads = orjson.loads
+
+    def _dumps(obj):
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+except ImportError:
+    _loads = json.loads
+
+    def _dumps(obj):
+        return json.dumps(obj, ensure_ascii=False, indent=2).encode("utf-8")
+
+def _default_tasks():
+    # Factory, not a module constant: a constant would bake the
+    # import-time timestamp into every fallback response forever
+    return [
+        {
+            "id": 1,
+            "title": "欢迎使用任务面板",
+            "status": "todo",
+            "created_at": datetime.now().isoformat(),
+        },
+    ]
+
+HTML = """<!DOCTYPE html>
+<html lang="zh">
+<head>
+<meta charset="utf-8">
+<title>📋 Quick Task Panel</title>
+<style>
+  body { font-family: -apple-system, sans-serif; margin: 20px; background: #f5f6f8; }
+  h1 { font-size: 20px; }
+  #board { display: flex; gap: 16px; }
+  .col { flex: 1; background: #fff; border-radius: 8px; padding: 12px; }
+  .col h2 { font-size: 14px; color: #666; margin: 0 0 8px; }
+  .card { border: 1px solid #e0e0e0; border-radius: 6px; padding: 8px; margin-bottom: 8px; }
+  .card .title { font-weight: 600; }
+  .card .time { color: #999; font-size: 11px; }
+  .card button { font-size: 11px; margin-top: 4px; }
+  #add { margin-bottom: 16px; }
+</style>
+</head>
+<body>
+<h1>📋 Quick Task Panel</h1>
+<div id="add">
+  <input id="new-title" placeholder="新任务标题...">
+  <button onclick="addTask()">添加</button>
+</div>
+<div id="board">
+  <div class="col"><h2>📥 Todo</h2><div id="col-todo"></div></div>
+  <div class="col"><h2>🚧 In Progress</h2><div id="col-progress"></div></div>
+  <div class="col"><h2>✅ Done</h2><div id="col-done"></div></div>
+</div>
+<script>
+const _ESC = {'&': '&amp;', '<': '&lt;', '>': '&gt;', '"': '&quot;', "'": '&#39;'};
+function escapeHtml(s) {
+  return s ? String(s).replace(/[&<>"']/g, c => _ESC[c]) : '';
+}
+
+const _timeCache = new Map();
+function formatTime(iso) {
+  if (!iso) return '';
+  let out = _timeCache.get(iso);
+  if (out === undefined) {
+    const d = new Date(iso);
+    out = d.toLocaleDateString() + ' ' + d.toLocaleTimeString().slice(0, 5);
+    _timeCache.set(iso, out);
+  }
+  return out;
+}
+
+// Card HTML memoized per (id, last-change, status): unchanged tasks
+// cost a Map hit instead of a template-string rebuild each poll
+const _cardCache = new Map();
+function cardKey(t) {
+  return t.id + '|' + (t.updated_at || t.created_at) + '|' + t.status;
+}
+
+function renderTaskCard(t) {
+  const k = cardKey(t);
+  const hit = _cardCache.get(k);
+  if (hit) return hit;
+  const next = t.status === 'todo' ? 'progress' : 'done';
+  const label = t.status === 'todo' ? '开始 ▶' : '完成 ✓';
+  let btn = t.status === 'done' ? '' :
+    `<button onclick="moveTask(${t.id}, '${next}')">${label}</button>`;
+  const html = `<div class="card" data-id="${t.id}">
+    <div class="title">${escapeHtml(t.title)}</div>
+    <div class="time">${formatTime(t.created_at)}</div>
+    ${btn}</div>`;
+  _cardCache.set(k, html);
+  return html;
+}
+
+function cardElement(t, k) {
+  const tpl = document.createElement('template');
+  tpl.innerHTML = renderTaskCard(t).trim();
+  const el = tpl.content.firstChild;
+  el.dataset.key = k;
+  return el;
+}
+
+// Diff against what's already in the DOM: untouched columns are
+// skipped entirely and existing nodes are moved, not rebuilt, so a
+// poll does O(changes) DOM work instead of three innerHTML rewrites
+function render(tasks) {
+  const byCol = {todo: [], progress: [], done: []};
+  for (const t of tasks) (byCol[t.status] || byCol.todo).push(t);
+  for (const status of ['todo', 'progress', 'done']) {
+    const col = document.getElementById('col-' + status);
+    const want = byCol[status];
+    const wantKeys = want.map(cardKey);
+    const have = Array.from(col.children);
+    if (have.length === want.length &&
+        wantKeys.every((k, i) => have[i].dataset.key === k)) continue;
+    const haveByKey = new Map(have.map(el => [el.dataset.key, el]));
+    const frag = document.createDocumentFragment();
+    want.forEach((t, i) =>
+      frag.appendChild(haveByKey.get(wantKeys[i]) || cardElement(t, wantKeys[i])));
+    col.replaceChildren(frag);
+  }
+  // Drop cache entries whose task disappeared or changed key
+  const live = new Set(tasks.map(cardKey));
+  for (const k of _cardCache.keys()) if (!live.has(k)) _cardCache.delete(k);
+}
+
+async function refresh() {
+  const resp = await fetch('/api/tasks');
+  render(await resp.json());
+}
+
+async function addTask() {
+  const input = document.getElementById('new-title');
+  if (!input.value.trim()) return;
+  await fetch('/api/add', {method: 'POST', body: JSON.stringify({title: input.value.trim()})});
+  input.value = '';
+  refresh();
+}
+
+async function moveTask(id, status) {
+  await fetch('/api/move', {method: 'POST', body: JSON.stringify({id, status})});
+  refresh();
+}
+
+refresh();
+setInterval(refresh, 15000);
+</script>
+</body>
+</html>
+"""
+
+# Encode (and compress) the page once at import; per-request work is
+# just writing the cached bytes out
+_HTML_BYTES = HTML.encode("utf-8")
+_HTML_GZ = gzip.compress(_HTML_BYTES, compresslevel=6)
+
+
+class Handler(BaseHTTPRequestHandler):
+
+    # Parsed task list memoized on the file's mtime: steady-state polls
+    # cost one stat() instead of a read + JSON parse per request
+    _cache = None
+    _cache_mtime = -1
+    _index = {}  # task id -> position in _cache, rebuilt with the cache
+    _save_lock = threading.Lock()
+
+    def setup(self):
+        super().setup()
+        # Tiny JSON bodies: don't let Nagle hold them back
+        self.connection.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
+    def log_message(self, fmt, *args):
+        pass  # keep the terminal quiet
+
+    # ── helpers ──────────────────────────────────────────────────
+
+    def _client_accepts_gzip(self):
+        return "gzip" in self.headers.get("Accept-Encoding", "")
+
+    def _send(self, status, content_type, body, gzipped=False, etag=None):
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        if gzipped:
+            self.send_header("Content-Encoding", "gzip")
+        if etag:
+            self.send_header("ETag", etag)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def send_html(self):
+        if self._client_accepts_gzip():
+            self._send(200, "text/html; charset=utf-8", _HTML_GZ, gzipped=True)
+        else:
+            self._send(200, "text/html; charset=utf-8", _HTML_BYTES)
+
+    def send_json(self, obj, etag=None):
+        body = json.dumps(obj, ensure_ascii=False).encode("utf-8")
+        if self._client_accepts_gzip() and len(body) > 512:
+            self._send(200, "application/json", gzip.compress(body, 6),
+                       gzipped=True, etag=etag)
+        else:
+            self._send(200, "application/json", body, etag=etag)
+
+    # ── tasks ────────────────────────────────────────────────────
+
+    def get_tasks(self):
+        cls = Handler
+        try:
+            st = os.stat(TASKS_FILE)
+        except FileNotFoundError:
+            # Seed the board on first read; save_tasks primes the
+            # cache, so later polls never take this path again
+            tasks = _default_tasks()
+            self.save_tasks(tasks)
+            return tasks
+        if st.st_mtime_ns != cls._cache_mtime:
+            cls._cache = _loads(TASKS_FILE.read_bytes())
+            cls._cache_mtime = st.st_mtime_ns
+            cls._index = {t["id"]: i for i, t in enumerate(cls._cache)}
+        return cls._cache
+
+    def save_tasks(self, tasks):
+        # Handlers run on worker threads (and possibly several forked
+        # workers); serialize writers in-process and across processes
+        with Handler._save_lock:
+            WORKSPACE.mkdir(parents=True, exist_ok=True)
+            if fcntl is not None:
+                with open(TASKS_FILE.with_suffix(".lock"), "w") as lf:
+                    fcntl.flock(lf, fcntl.LOCK_EX)
+                    TASKS_FILE.write_bytes(_dumps(tasks))
+            else:
+                TASKS_FILE.write_bytes(_dumps(tasks))
+            # Write-through so our own mutation doesn't force a re-parse
+            cls = Handler
+            cls._cache = tasks
+            cls._cache_mtime = os.stat(TASKS_FILE).st_mtime_ns
+            cls._index = {t["id"]: i for i, t in enumerate(tasks)}
+
+    def _read_body(self):
+        length = int(self.headers.get("Content-Length", 0))
+        return _loads(self.rfile.read(length)) if length else {}
+
+    def handle_add(self):
+        payload = self._read_body()
+        tasks = self.get_tasks()
+        task = {
+            "id": max((t["id"] for t in tasks), default=0) + 1,
+            "title": payload.get("title", ""),
+            "status": "todo",
+            "created_at": datetime.now().isoformat(),
+        }
+        tasks.append(task)
+        self.save_tasks(tasks)
+        self.send_json(task)
+
+    def handle_move(self):
+        payload = self._read_body()
+        tasks = self.get_tasks()
+        i = Handler._index.get(payload.get("id"))
+        if i is None:
+            self._send(404, "application/json", b'{"error":"not found"}')
+            return
+        t = tasks[i]
+        t["status"] = payload.get("status", t["status"])
+        t["updated_at"] = datetime.now().isoformat()
+        self.save_tasks(tasks)
+        self.send_json(t)
+
+    # ── routing ──────────────────────────────────────────────────
+
+    def do_GET(self):
+        if self.path == "/":
+            self.send_html()
+        elif self.path == "/api/tasks":
+            tasks = self.get_tasks()
+            # Idle polls are byte-identical; let the browser's
+            # If-None-Match round-trip turn them into empty 304s
+            etag = f'W/"{Handler._cache_mtime}"'
+            if self.headers.get("If-None-Match") == etag:
+                self.send_response(304)
+                self.end_headers()
+                return
+            self.send_json(tasks, etag=etag)
+        else:
+            self._send(404, "text/plain", b"not found")
+
+    def do_POST(self):
+        if self.path == "/api/add":
+            self.handle_add()
+        elif self.path == "/api/move":
+            self.handle_move()
+        else:
+            self._send(404, "text/plain", b"not found")
+
+
+class Server(ThreadingHTTPServer):
+    """Threaded server so one slow request can't stall the panel."""
+    allow_reuse_address = True
+    daemon_threads = True
+
+    def server_bind(self):
+        if hasattr(socket, "SO_REUSEPORT"):
+            self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
+        super().server_bind()
+
+
+_NUM_WORKERS = min(4, os.cpu_count() or 1)
+
+
+def _fork_workers():
+    """Pre-fork workers sharing port 8765 via SO_REUSEPORT.
+
+    Each process binds its own listening socket and the kernel balances
+    accepts between them, so multi-tab polling doesn't contend on one
+    accept queue. Returns True in the parent process.
+    """
+    if not (hasattr(os, "fork") and hasattr(socket, "SO_REUSEPORT")):
+        return True
+    children = []
+    for _ in range(_NUM_WORKERS - 1):
+        pid = os.fork()
+        if pid == 0:
+            return False
+        children.append(pid)
+    if children:
+        def _shutdown(signum, frame):
+            for pid in children:
+                try:
+                    os.kill(pid, signal.SIGTERM)
+                    os.waitpid(pid, 0)
+                except OSError:
+                    pass
+            raise SystemExit(0)
+        signal.signal(signal.SIGTERM, _shutdown)
+        signal.signal(signal.SIGINT, _shutdown)
+    return True
+
+
+def _open_browser_later():
+    # xdg-open/open can block for hundreds of ms; launch it from a
+    # background thread once serve_forever is accepting, so the first
+    # page load can't race a not-yet-listening server
+    def _open():
+        time.sleep(0.1)
+        webbrowser.open(f"http://localhost:{PORT}")
+    threading.Thread(target=_open, daemon=True).start()
+
+
+def run():
+    is_parent = _fork_workers()
+    httpd = Server(("", PORT), Handler)
+    if is_parent:
+        print(f"📋 Task panel on http://localhost:{PORT} ({_NUM_WORKERS} workers)")
+        _open_browser_later()
+    httpd.serve_forever()
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,26 @@
+#!/usr/bin/env python3
+"""
+record-capability-tasks
+把今日能力建设任务登记到 task-board.json
+"""
+
+from _taskboard import batch_add, load_tasks, save_tasks
+
+TODAY_TASKS = [
+    {"title": "梳理 skills 目录的能力清单", "category": "capability"},
+    {"title": "补全 marketplace.json 元数据", "category": "capability"},
+    {"title": "为新技能写 SKILL.md 草稿", "category": "capability"},
+    {"title": "检查 memory/ 索引一致性", "category": "capability"},
+]
+
+
+def main():
+    tasks = load_tasks()
+    for task in batch_add(tasks, TODAY_TASKS):
+        print(f"  ➕ [{task['id']}] {task['title']}")
+    save_tasks(tasks)
+    print(f"✅ Recorded {len(TODAY_TASKS)} capability tasks")
+
+
+if __name__ == "__main__":
+    main()
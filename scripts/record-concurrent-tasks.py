@@ -0,0 +1,26 @@
+#!/usr/bin/env python3
+"""
+record-concurrent-tasks
+把并发改造相关待办登记到 task-board.json
+"""
+
+from _taskboard import batch_add, load_tasks, save_tasks
+
+TODAY_TASKS = [
+    {"title": "给 briefing 天气抓取加并发", "category": "concurrency"},
+    {"title": "task-panel 切 ThreadingHTTPServer", "category": "concurrency"},
+    {"title": "port-manager 批量端口扫描", "category": "concurrency"},
+    {"title": "record-* 脚本批量写盘", "category": "concurrency"},
+]
+
+
+def main():
+    tasks = load_tasks()
+    for task in batch_add(tasks, TODAY_TASKS):
+        print(f"  ➕ [{task['id']}] {task['title']}")
+    save_tasks(tasks)
+    print(f"✅ Recorded {len(TODAY_TASKS)} concurrency tasks")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,43 @@
+#!/usr/bin/env python3
+"""
+record-final-status
+收尾：把今日完成情况写回 task-board.json
+"""
+
+from datetime import datetime
+
+from _taskboard import load_tasks, save_tasks
+
+# 今日收尾时标记完成的任务标题
+COMPLETED_TITLES = [
+    "安装 openclaw gateway 依赖",
+    "record-* 脚本批量写盘",
+]
+
+# 状态图标查表，比链式三元表达式省掉逐个字符串比较
+STATUS_ICON = {"done": "✅", "in_progress": "🔵", "progress": "🔵", "todo": "⚪"}
+
+
+def main():
+    tasks = load_tasks()
+    now = datetime.now().isoformat()
+    completed = set(COMPLETED_TITLES)
+    hit = 0
+    for t in tasks:
+        if t.get("title") in completed and t.get("status") != "done":
+            t["status"] = "done"
+            t["updated_at"] = now
+            hit += 1
+    save_tasks(tasks)
+
+    done = 0
+    for t in tasks:
+        status = t.get("status", "todo")
+        if status == "done":
+            done += 1
+        print(f"  {STATUS_ICON.get(status, '⚪')} {t.get('title', '?')}")
+    print(f"✅ Marked {hit} tasks done; board now {done}/{len(tasks)} complete")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+"""
+record-install-tasks
+把工具安装待办登记到 task-board.json（按标题去重）
+"""
+
+from datetime import datetime
+
+from _taskboard import add_task_inplace, load_tasks, next_task_id, save_tasks
+
+TODAY_TASKS = [
+    {"title": "安装 openclaw gateway 依赖", "category": "install"},
+    {"title": "部署 quick-task-panel 到本机", "category": "install"},
+    {"title": "配置 port-manager 预留端口段", "category": "install"},
+    {"title": "校验 skills 安装目录权限", "category": "install"},
+    {"title": "升级 mcp-filesystem server", "category": "install"},
+    {"title": "清理过期的 .state 锁文件", "category": "install"},
+]
+
+
+def _index(tasks):
+    """Title -> task map, built once so dedupe lookups are O(1)."""
+    return {t["title"]: t for t in tasks if "title" in t}
+
+
+def _add_if_absent(tasks, index, title, category, now, id_):
+    if title in index:
+        return None
+    task = add_task_inplace(tasks, title, category, now, id_)
+    index[title] = task
+    return task
+
+
+def main():
+    tasks = load_tasks()
+    index = _index(tasks)
+    now = datetime.now().isoformat()
+    id_ = next_task_id(tasks)
+    added = 0
+    for cfg in TODAY_TASKS:
+        task = _add_if_absent(tasks, index, cfg["title"], cfg["category"],
+                              now, id_)
+        if task is None:
+            continue  # already on the board
+        print(f"  ➕ [{task['id']}] {task['title']}")
+        id_ += 1
+        added += 1
+    if added:
+        save_tasks(tasks)
+    print(f"✅ Recorded {added} install tasks ({len(TODAY_TASKS) - added} already present)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,25 @@
+#!/usr/bin/env python3
+"""
+record-tasks
+从命令行批量登记任务：record-tasks.py "标题1" "标题2" ...
+"""
+
+import sys
+
+from _taskboard import batch_add, load_tasks, save_tasks
+
+
+def main():
+    titles = sys.argv[1:]
+    if not titles:
+        print("Usage: record-tasks.py <title> [title ...]")
+        sys.exit(1)
+    tasks = load_tasks()
+    for task in batch_add(tasks, [{"title": t} for t in titles]):
+        print(f"  ➕ [{task['id']}] {task['title']}")
+    save_tasks(tasks)
+    print(f"✅ Recorded {len(titles)} tasks")
+
+
+if __name__ == "__main__":
+    main()
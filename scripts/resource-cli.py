@@ -0,0 +1,419 @@
+#!/usr/bin/env python3
+"""
+resource-cli
+资源感知 CLI：API 状态 / 任务进度 / 资源需求一览
+
+Heartbeat scripts poll this to decide whether the agent should ask for
+help or acquire more resources; state lives under
+~/.openclaw/workspace/.state/resource/.
+"""
+
+import atexit
+import json
+import os
+import sys
+import time
+from collections import Counter
+from datetime import datetime
+from pathlib import Path
+
+try:
+    import requests
+    from requests.adapters import HTTPAdapter, Retry
+
+    # 复用连接的会话：重复探活不再每次 TCP+TLS 握手
+    _SESSION = requests.Session()
+    _SESSION.mount("https://", HTTPAdapter(
+        pool_connections=4, pool_maxsize=8,
+        max_retries=Retry(total=2, backoff_factor=0.2)))
+except ImportError:
+    _SESSION = None
+
+WORKSPACE = Path.home() / ".openclaw" / "workspace"
+TASKS_FILE = WORKSPACE / "task-board.json"
+
+# Optional fast JSON path, same shim as _taskboard/quick-task-panel
+try:
+    import orjson
+
+    _loads = orjson.loads
+
+    def _dumps(obj):
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+except ImportError:
+    _loads = json.loads
+
+    def _dumps(obj):
+        return json.dumps(obj, ensure_ascii=False, indent=2).encode("utf-8")
+
+# 任务板只关心 status 字段；msgspec 能按结构解码、跳过无关键，
+# 免去每个任务一个 dict 的分配。没装就回退到通用 JSON 路径。
+try:
+    import msgspec
+
+    class _Task(msgspec.Struct):
+        status: str = "todo"
+
+    _task_decoder = msgspec.json.Decoder(list[_Task])
+except ImportError:
+    _task_decoder = None
+
+# 大任务板走 ijson 流式统计，不整份载入内存；小文件流式反而慢
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+_STREAM_THRESHOLD = 64 * 1024
+
+# 完整报告的 TTL：窗口内连发 status/needs/report 复用上一份结果
+REPORT_TTL = 5.0
+
+MINIMAX_USAGE_URL = "https://api.minimaxi.com/v1/usage"
+
+# 进行中状态集合：frozenset 常量，成员判断 O(1) 且零分配
+_IN_PROGRESS_STATUSES = frozenset({"progress", "in_progress"})
+
+
+def _atomic_write_json(path, obj):
+    """写临时文件再 os.replace 换入：中途崩溃也不会留半截 JSON"""
+    tmp = path.with_suffix(path.suffix + ".tmp")
+    tmp.write_bytes(_dumps(obj))
+    os.replace(tmp, path)
+
+
+class ResourceManager:
+    """注册表 + 状态两份 JSON 的内存视图，加一组 sense_* 采样器"""
+
+    __slots__ = ("workspace", "data_dir", "registry_file", "state_file",
+                 "_registry", "_state", "_registry_hash", "_state_hash",
+                 "_json_cache", "_state_dirty", "_by_type_name",
+                 "report_cache_file", "_last_report", "_last_report_time")
+
+    # 纯常量提到类级，避免热轮询时每次调用都重建
+    _HELP_REQUESTS = (
+        {"kind": "api-key", "when": "health == no-key"},
+        {"kind": "quota", "when": "health == http-429"},
+        {"kind": "review", "when": "tasks stalled > 1d"},
+    )
+
+    def __init__(self):
+        self.workspace = WORKSPACE
+        self.data_dir = self.workspace / ".state" / "resource"
+        self.registry_file = self.data_dir / "registry.json"
+        self.state_file = self.data_dir / "state.json"
+        self.report_cache_file = self.data_dir / "last_report.json"
+        # (mtime_ns, parsed) per path：同一文件重复读直接走字典
+        self._json_cache = {}
+        # 懒加载：两份 JSON 都等到首次访问才读盘，轻量命令零启动 I/O
+        self._registry = None
+        self._state = None
+        self._registry_hash = None
+        self._state_hash = None
+        self._by_type_name = None
+        # sense_* 只置脏标记，进程内合并成一次 flush；atexit 兜底
+        self._state_dirty = False
+        self._last_report = None
+        self._last_report_time = 0.0
+        atexit.register(self.flush_state)
+
+    # cached_property 依赖 __dict__，和 __slots__ 冲突；
+    # None 哨兵 + property 等效地做到一次性懒加载
+    @property
+    def registry(self):
+        if self._registry is None:
+            self._registry = self.load_registry()
+            self._registry_hash = self._snapshot(self._registry)
+            # (type, name) -> resource 二级索引，查找 O(N) 扫描降到 O(1)
+            self._by_type_name = {
+                (res.get("type"), res.get("name")): res
+                for res in self._registry["resources"].values()
+            }
+        return self._registry
+
+    @property
+    def state(self):
+        if self._state is None:
+            self._state = self.load_state()
+            self._state_hash = self._snapshot(self._state)
+        return self._state
+
+    # ── persistence ──────────────────────────────────────────────
+
+    def _load_json(self, path, default):
+        """mtime 作 key 的读穿缓存：文件没变就不再反序列化"""
+        try:
+            mtime = path.stat().st_mtime_ns
+        except FileNotFoundError:
+            return default
+        cached = self._json_cache.get(path)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+        data = _loads(path.read_bytes())
+        self._json_cache[path] = (mtime, data)
+        return data
+
+    def load_registry(self):
+        return self._load_json(self.registry_file,
+                               {"version": "1.0", "resources": {}})
+
+    def load_state(self):
+        return self._load_json(self.state_file,
+                               {"api": {}, "tasks": {}, "needs": []})
+
+    @staticmethod
+    def _snapshot(obj):
+        # 脏检查指纹：序列化一次求 hash，比保存一份深拷贝再比较便宜
+        return hash(json.dumps(obj, sort_keys=True, ensure_ascii=False))
+
+    def save_registry(self):
+        # 内容没变就不落盘——心跳轮询下绝大多数保存可以直接跳过
+        new_hash = self._snapshot(self.registry)
+        if new_hash == self._registry_hash:
+            return
+        self.data_dir.mkdir(parents=True, exist_ok=True)
+        _atomic_write_json(self.registry_file, self.registry)
+        self._registry_hash = new_hash
+        self._json_cache[self.registry_file] = (
+            self.registry_file.stat().st_mtime_ns, self.registry)
+
+    def _mark_dirty(self):
+        self._state_dirty = True
+
+    def flush_state(self):
+        """把攒下的 state 变更一次性落盘（tmp + os.replace 原子换入）"""
+        if not self._state_dirty:
+            return
+        new_hash = self._snapshot(self.state)
+        if new_hash != self._state_hash:
+            self.data_dir.mkdir(parents=True, exist_ok=True)
+            _atomic_write_json(self.state_file, self.state)
+            self._state_hash = new_hash
+            self._json_cache[self.state_file] = (
+                self.state_file.stat().st_mtime_ns, self.state)
+        self._state_dirty = False
+
+    # ── registry ─────────────────────────────────────────────────
+
+    def _index(self):
+        if self._by_type_name is None:
+            _ = self.registry  # 触发懒加载，顺带建索引
+        return self._by_type_name
+
+    def get_resource(self, rtype, name):
+        return self._index().get((rtype, name))
+
+    def should_acquire(self, rtype, name):
+        res = self._index().get((rtype, name))
+        if res is None:
+            return True
+        return res.get("status") == "expired"
+
+    # ── sensors ──────────────────────────────────────────────────
+
+    def _check_api_health(self, name):
+        """已知 API 的健康检查方式；没有探针的一律 unknown"""
+        check = self._API_CHECKS.get(name)
+        return check(self) if check else "unknown"
+
+    def check_minimax_usage(self):
+        if _SESSION is None:
+            return "unknown"
+        key = os.environ.get("MINIMAX_API_KEY")
+        if not key:
+            return "no-key"
+        try:
+            resp = _SESSION.get(
+                MINIMAX_USAGE_URL,
+                headers={"Authorization": f"Bearer {key}"}, timeout=5)
+            return "ok" if resp.status_code == 200 else f"http-{resp.status_code}"
+        except Exception:
+            return "unreachable"
+
+    # 探针表建一次挂在类上，不再每次调用重建；值是未绑定方法
+    _API_CHECKS = {"minimax": check_minimax_usage}
+
+    # 名单预先排好序的 tuple 常量，不再每次 sorted() 重建列表
+    _API_NAMES = ("anthropic", "github", "minimax", "openai", "wttr")
+
+    def _compute_api_status(self):
+        # 整批共用一个时间戳：5 次 datetime 构造 + 格式化收敛成 1 次
+        now_iso = datetime.now().isoformat()
+        return {
+            name: {"health": self._check_api_health(name),
+                   "checked_at": now_iso}
+            for name in self._API_NAMES
+        }
+
+    def sense_api_status(self):
+        status = self._compute_api_status()
+        self.state["api"] = status
+        self._mark_dirty()
+        return status
+
+    def _count_statuses(self):
+        """返回 (total, Counter)：按文件大小和可用依赖挑最省的一条路径"""
+        try:
+            size = TASKS_FILE.stat().st_size
+        except FileNotFoundError:
+            return 0, Counter()
+        if ijson is not None and size > _STREAM_THRESHOLD:
+            # 流式只取 status 字段，内存占用与任务数无关
+            total = 0
+            c = Counter()
+            with open(TASKS_FILE, "rb") as f:
+                for status in ijson.items(f, "item.status"):
+                    c[status] += 1
+                    total += 1
+            return total, c
+        if _task_decoder is not None:
+            tasks = _task_decoder.decode(TASKS_FILE.read_bytes())
+            return len(tasks), Counter(t.status for t in tasks)
+        tasks = self._load_json(TASKS_FILE, [])
+        return len(tasks), Counter(t.get("status") for t in tasks)
+
+    def _compute_task_progress(self):
+        # Counter 一趟数完所有状态，循环体在 C 层跑
+        total, c = self._count_statuses()
+        completed = c.get("done", 0)
+        in_progress = sum(c[s] for s in _IN_PROGRESS_STATUSES)
+        return {
+            "total": total,
+            "completed": completed,
+            "in_progress": in_progress,
+            # total==0 时 completed 也必为 0，(total or 1) 免去分支
+            "pct": round(completed * 100.0 / (total or 1), 1),
+            "checked_at": datetime.now().isoformat(),
+        }
+
+    def sense_task_progress(self):
+        progress = self._compute_task_progress()
+        self.state["tasks"] = progress
+        self._mark_dirty()
+        return progress
+
+    def _compute_needs(self, task_progress):
+        needs = []
+        for key, res in self.registry["resources"].items():
+            if res.get("status") == "expired":
+                needs.append({"resource": key, "reason": "expired"})
+        if task_progress.get("total", 0) and \
+                task_progress.get("completed") == task_progress.get("total"):
+            needs.append({"resource": "tasks", "reason": "board drained"})
+        return needs
+
+    def sense_resource_needs(self):
+        needs = self._compute_needs(self.state.get("tasks", {}))
+        self.state["needs"] = needs
+        self._mark_dirty()
+        return needs
+
+    def _sense_all(self):
+        """融合三个采样器：结果留在局部变量，state 只写一轮"""
+        api = self._compute_api_status()
+        tasks = self._compute_task_progress()
+        # needs 直接吃 tasks 局部值，不经 state 字典绕一圈
+        needs = self._compute_needs(tasks)
+        state = self.state
+        state["api"] = api
+        state["tasks"] = tasks
+        state["needs"] = needs
+        self._mark_dirty()
+        return api, tasks, needs
+
+    def get_help_requests(self):
+        return list(self._HELP_REQUESTS)
+
+    # ── reports ──────────────────────────────────────────────────
+
+    def full_status_report(self):
+        # 进程内先看上一份：连续调用（print_status 后再 report）不碰盘
+        now = time.time()
+        if self._last_report is not None and \
+                now - self._last_report_time < REPORT_TTL:
+            return self._last_report
+        # TTL 内直接复用上一份报告：跨进程的背靠背调用也能命中
+        try:
+            age = now - self.report_cache_file.stat().st_mtime
+            if age < REPORT_TTL:
+                report = self._load_json(self.report_cache_file, None)
+                self._last_report = report
+                self._last_report_time = now
+                return report
+        except FileNotFoundError:
+            pass
+        # Fused traversal: one state write, one flush for the batch
+        api, tasks, needs = self._sense_all()
+        report = {
+            "api": api,
+            "tasks": tasks,
+            "needs": needs,
+            "generated_at": datetime.now().isoformat(),
+        }
+        self.flush_state()
+        self.data_dir.mkdir(parents=True, exist_ok=True)
+        _atomic_write_json(self.report_cache_file, report)
+        self._last_report = report
+        self._last_report_time = now
+        return report
+
+    def print_status(self):
+        # 攒成一段再写：一次 stdout 写出代替十来次带锁的 print
+        report = self.full_status_report()
+        out = ["", "📊 Resource Status", ""]
+        out += [f"  🔌 {name}: {info['health']}"
+                for name, info in report["api"].items()]
+        t = report["tasks"]
+        out.append(f"\n  📋 Tasks: {t['completed']}/{t['total']} done "
+                   f"({t['pct']}%), {t['in_progress']} in progress")
+        if report["needs"]:
+            out.append("\n  ⚠️  Needs:")
+            out += [f"    - {need['resource']}: {need['reason']}"
+                    for need in report["needs"]]
+        out.append("")
+        sys.stdout.write("\n".join(out) + "\n")
+
+
+def _cmd_status(manager):
+    manager.print_status()
+
+
+def _cmd_report(manager):
+    print(json.dumps(manager.full_status_report(),
+                     indent=2, ensure_ascii=False))
+
+
+def _cmd_get(manager):
+    value = manager.state
+    for key in (sys.argv[2].split(".") if len(sys.argv) > 2 else []):
+        value = value.get(key) if isinstance(value, dict) else None
+    # 直接把序列化好的 bytes 写给 stdout，不经过 str 再编码一遍
+    sys.stdout.buffer.write(_dumps(value) + b"\n")
+
+
+def _cmd_needs(manager):
+    for need in manager.sense_resource_needs():
+        print(f"  - {need['resource']}: {need['reason']}")
+    manager.flush_state()
+
+
+COMMANDS = {
+    "status": _cmd_status,
+    "report": _cmd_report,
+    "get": _cmd_get,
+    "needs": _cmd_needs,
+}
+
+
+def main():
+    cmd = sys.argv[1] if len(sys.argv) > 1 else "status"
+    handler = COMMANDS.get(cmd)
+    if handler is None:
+        print(f"Unknown command: {cmd}")
+        print(f"Usage: resource-cli.py [{'|'.join(COMMANDS)}]")
+        sys.exit(1)
+    handler(ResourceManager())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,433 @@
+#!/usr/bin/env python3
+"""
+resource-monitor
+API 调用统计 + 系统资源监控（CPU / 内存 / 磁盘）
+
+Agent 工具在每次模型/API 调用后上报 record_api_call；status 子命令
+画一个资源面板。统计落在 ~/.openclaw/workspace/.state/monitor/ 下。
+"""
+
+import atexit
+import fcntl
+import functools
+import json
+import os
+import shutil
+import statistics
+import subprocess
+import sys
+import time
+from collections import deque
+from datetime import datetime
+from pathlib import Path
+
+# Optional fast JSON path, same shim as the other .state writers;
+# 这里热路径要紧凑输出，所以不带缩进
+try:
+    import orjson
+
+    _loads = orjson.loads
+    _dumps_compact = orjson.dumps
+except ImportError:
+    _loads = json.loads
+
+    def _dumps_compact(obj):
+        return json.dumps(obj, ensure_ascii=False,
+                          separators=(",", ":")).encode("utf-8")
+
+# psutil 在模块加载时解析一次；没有就走 top//proc 兜底采样
+try:
+    import psutil
+except ImportError:
+    psutil = None
+
+CONFIG_DIR = Path.home() / ".openclaw" / "workspace" / ".state" / "monitor"
+STATS_FILE = CONFIG_DIR / "resource-stats.json"
+REQUESTS_LOG = CONFIG_DIR / "requests.jsonl"
+
+# 日志超过这个大小就重写成只留尾部的新文件
+LOG_TRUNCATE_BYTES = 256 * 1024
+LOG_KEEP_LINES = 100
+
+# 系统读数变化很慢，轮询之间可以放心复用
+CACHE_TTL = 60
+
+# 计数满 50 条或距上次落盘超 5s 才写文件：突发上报合并成一次写
+FLUSH_EVERY = 50
+FLUSH_SECONDS = 5.0
+
+# 跨进程合并的累计计数字段
+_COUNTERS = ("api_calls", "cached_calls", "live_calls", "total_tokens")
+
+
+def _fmt_bytes(n):
+    for unit in ("B", "K", "M", "G"):
+        if n < 1024:
+            return f"{n:.1f}{unit}"
+        n /= 1024
+    return f"{n:.1f}T"
+
+
+class ResourceMonitor:
+    """统计 API 调用并采样本机资源占用"""
+
+    def __init__(self):
+        # 懒加载：status 只看系统读数，不该为它读统计 JSON
+        self._stats = None
+        self._flushed = None
+        self._dirty_since = 0
+        self._last_flush = time.monotonic()
+        self._log_handle = None
+        # (monotonic 时间戳, 读数)：TTL 内的重复 status 不再碰系统
+        self._sys_cache = (0.0, None)
+        self._fallback_cache = (0.0, None)
+        self._cpu_primed = False
+        # 子进程跟踪默认关；开了也是增量维护集合，不每次全量枚举
+        self._track_children = (psutil is not None and
+                                os.environ.get("OPENCLAW_TRACK_CHILDREN") == "1")
+        self._proc = psutil.Process() if self._track_children else None
+        self._children = set()
+        # 每个 provider 一条滚动延迟窗口，算 p95 不用回扫整个日志
+        self._latencies = {}
+        # 进程退出时兜底落盘，攒在内存里的计数不会丢
+        atexit.register(self._save_stats, durable=True)
+
+    # ── stats persistence ────────────────────────────────────────
+
+    @property
+    def stats(self):
+        if self._stats is None:
+            self._stats = self._load_stats()
+            # 上次落盘时的计数快照：保存时只把增量并进盘上数据
+            self._flushed = {k: self._stats.get(k, 0) for k in _COUNTERS}
+        return self._stats
+
+    def _load_stats(self):
+        try:
+            return _loads(STATS_FILE.read_bytes())
+        except Exception:
+            return {"api_calls": 0, "cached_calls": 0, "live_calls": 0,
+                    "total_tokens": 0}
+
+    def _save_stats(self, durable=False):
+        if self._dirty_since == 0:
+            return
+        CONFIG_DIR.mkdir(parents=True, exist_ok=True)
+        # flock 串行化并发进程的读-改-写；本进程只把自己的增量
+        # 加到盘上数据，不会整份覆盖掉别人的计数
+        lock = open(STATS_FILE.with_suffix(".lock"), "w")
+        try:
+            fcntl.flock(lock, fcntl.LOCK_EX)
+            try:
+                on_disk = _loads(STATS_FILE.read_bytes())
+            except Exception:
+                on_disk = {}
+            for key in _COUNTERS:
+                delta = self.stats.get(key, 0) - self._flushed.get(key, 0)
+                self.stats[key] = on_disk.get(key, 0) + delta
+            # 热路径写紧凑 JSON；好看的缩进版只在 stats 子命令输出时排。
+            # 临时文件 + os.replace：写一半崩掉也不会清空计数
+            tmp = STATS_FILE.with_suffix(".json.tmp")
+            with open(tmp, "wb") as f:
+                f.write(_dumps_compact(self.stats))
+                if durable:
+                    # 只有退出前的收尾 flush 付 fsync 的钱
+                    f.flush()
+                    os.fsync(f.fileno())
+            os.replace(tmp, STATS_FILE)
+        finally:
+            fcntl.flock(lock, fcntl.LOCK_UN)
+            lock.close()
+        self._flushed = {k: self.stats.get(k, 0) for k in _COUNTERS}
+        self._dirty_since = 0
+        self._last_flush = time.monotonic()
+
+    # ── API accounting ───────────────────────────────────────────
+
+    def _log(self):
+        """追加句柄进程内只开一次"""
+        if self._log_handle is None:
+            CONFIG_DIR.mkdir(parents=True, exist_ok=True)
+            self._log_handle = open(REQUESTS_LOG, "ab")
+        return self._log_handle
+
+    def _maybe_truncate_log(self):
+        # 日志长大后重写成只留尾部：写临时文件再 rename 原子换入
+        try:
+            if REQUESTS_LOG.stat().st_size < LOG_TRUNCATE_BYTES:
+                return
+        except FileNotFoundError:
+            return
+        self._log_handle.close()
+        self._log_handle = None
+        with open(REQUESTS_LOG, encoding="utf-8") as f:
+            tail = deque(f, maxlen=LOG_KEEP_LINES)
+        tmp = REQUESTS_LOG.with_suffix(".jsonl.tmp")
+        tmp.write_text("".join(tail), encoding="utf-8")
+        os.replace(tmp, REQUESTS_LOG)
+
+    def record_api_call(self, provider, endpoint, tokens=0, cached=False,
+                        latency_ms=0, result_bytes=0):
+        s = self.stats
+        s["api_calls"] += 1
+        # live/cached 各自内联累加，读侧不用再做差
+        if cached:
+            s["cached_calls"] += 1
+        else:
+            s["live_calls"] = s.get("live_calls", 0) + 1
+        s["total_tokens"] += tokens
+        # 延迟/结果大小进记录，给后续缓存准入决策留数据；
+        # 滚动窗口放内存，p95 随手可算
+        if latency_ms:
+            window = self._latencies.get(provider)
+            if window is None:
+                window = self._latencies[provider] = deque(maxlen=256)
+            window.append(latency_ms)
+        # 明细走 append-only JSONL：每条一次 write，不再重排全量大 JSON
+        # 写侧只存整数纳秒，ISO 格式化推迟到读侧的最后 10 条
+        rec = {
+            "provider": provider,
+            "endpoint": endpoint,
+            "tokens": tokens,
+            "cached": cached,
+            "ms": latency_ms,
+            "bytes": result_bytes,
+            "ts": time.time_ns(),
+        }
+        self._log().write(_dumps_compact(rec) + b"\n")
+        self._maybe_truncate_log()
+        # 小计数文件按条数/时间窗合并落盘
+        self._dirty_since += 1
+        if (self._dirty_since >= FLUSH_EVERY
+                or time.monotonic() - self._last_flush > FLUSH_SECONDS):
+            self._save_stats()
+
+    def _recent_requests(self, n=10):
+        try:
+            with open(REQUESTS_LOG, "rb") as f:
+                recent = [_loads(line) for line in deque(f, maxlen=n)]
+        except FileNotFoundError:
+            return []
+        for rec in recent:
+            ts = rec.pop("ts", None)
+            if ts is not None:
+                rec["at"] = datetime.fromtimestamp(ts / 1e9).isoformat()
+        return recent
+
+    def get_api_stats(self):
+        s = self.stats
+        total = s["api_calls"]
+        cached = s["cached_calls"]
+        # 百分号格式化只在读的时候做一次，写路径不碰字符串
+        return {
+            "total_calls": total,
+            "cached_calls": cached,
+            "live_calls": s.get("live_calls", total - cached),
+            "cache_rate": f"{cached * 100.0 / (total or 1):.1f}%",
+            "total_tokens": s["total_tokens"],
+            "p95_latency_ms": self._p95_latencies(),
+            "recent": self._recent_requests(),
+        }
+
+    def _p95_latencies(self):
+        p95 = {}
+        for provider, window in self._latencies.items():
+            if len(window) >= 2:
+                p95[provider] = round(
+                    statistics.quantiles(window, n=20)[-1], 1)
+            elif window:
+                p95[provider] = float(window[0])
+        return p95
+
+    # ── system sampling ──────────────────────────────────────────
+
+    def _cpu_psutil(self):
+        # 非阻塞采样：第一次调用先打个底，之后拿自上次以来的均值，
+        # 不再为每次读数睡 1 秒
+        if not self._cpu_primed:
+            psutil.cpu_percent(interval=None)
+            self._cpu_primed = True
+            time.sleep(0.1)
+        return psutil.cpu_percent(interval=None)
+
+    def _sample_fallback(self):
+        """无 psutil 时一次 top 同时解析 CPU 和内存，按 TTL 复用"""
+        ts, sample = self._fallback_cache
+        if sample is not None and time.monotonic() - ts < CACHE_TTL:
+            return sample
+        cpu = 0.0
+        mem = None
+        try:
+            cmd = (["top", "-l", "1", "-s", "0"] if sys.platform == "darwin"
+                   else ["top", "-b", "-n", "1"])
+            out = subprocess.run(cmd, capture_output=True, text=True,
+                                 timeout=5).stdout
+            for line in out.splitlines():
+                if "Cpu" in line or "CPU usage" in line:
+                    for tok in line.replace("%", " ").split():
+                        try:
+                            cpu = float(tok)
+                            break
+                        except ValueError:
+                            continue
+                elif line.startswith(("MiB Mem", "KiB Mem")):
+                    unit = 1024 ** 2 if line.startswith("MiB") else 1024
+                    nums = []
+                    for tok in line.replace(",", " ").split():
+                        try:
+                            nums.append(float(tok))
+                        except ValueError:
+                            continue
+                    if len(nums) >= 3:  # total, free, used
+                        total, used = nums[0] * unit, nums[2] * unit
+                        mem = {"used": _fmt_bytes(used),
+                               "total": _fmt_bytes(total),
+                               "percent": used / total * 100 if total else 0.0}
+        except Exception:
+            pass
+        if mem is None:
+            mem = self._mem_from_meminfo()
+        sample = (cpu, mem)
+        self._fallback_cache = (time.monotonic(), sample)
+        return sample
+
+    @staticmethod
+    def _mem_from_meminfo():
+        try:
+            info = {}
+            for line in Path("/proc/meminfo").read_text().splitlines():
+                key, _, rest = line.partition(":")
+                info[key] = int(rest.split()[0]) * 1024
+            total = info.get("MemTotal", 0)
+            used = total - info.get("MemAvailable", 0)
+            return {"used": _fmt_bytes(used), "total": _fmt_bytes(total),
+                    "percent": used / total * 100 if total else 0.0}
+        except Exception:
+            return {"used": "?", "total": "?", "percent": 0.0}
+
+    def _cpu_fallback(self):
+        return self._sample_fallback()[0]
+
+    def _mem_psutil(self):
+        vm = psutil.virtual_memory()
+        return {"used": _fmt_bytes(vm.used),
+                "total": _fmt_bytes(vm.total),
+                "percent": vm.percent}
+
+    def _mem_fallback(self):
+        return self._sample_fallback()[1]
+
+    @staticmethod
+    @functools.lru_cache(maxsize=1)
+    def _disk_usage_cached(_window):
+        # _window = monotonic()//CACHE_TTL：窗口号一变缓存自然失效
+        du = shutil.disk_usage("/")
+        return {"used": _fmt_bytes(du.used), "total": _fmt_bytes(du.total),
+                "percent": du.used / du.total * 100 if du.total else 0.0}
+
+    def get_disk_usage(self):
+        return self._disk_usage_cached(int(time.monotonic() // CACHE_TTL))
+
+    # 采样策略在类体里一次性定型，调用方不再每次 try/except 探测
+    get_cpu_usage = _cpu_psutil if psutil else _cpu_fallback
+    get_memory_usage = _mem_psutil if psutil else _mem_fallback
+
+    def _sample_children(self):
+        """增量维护子进程集合：只找新增、剔除已退出，再逐个 oneshot 聚合"""
+        new = set(self._proc.children(recursive=True)) - self._children
+        self._children |= new
+        self._children = {c for c in self._children if c.is_running()}
+        cpu = mem = 0.0
+        for child in self._children:
+            try:
+                with child.oneshot():
+                    cpu += child.cpu_percent(interval=None)
+                    mem += child.memory_info().rss
+            except psutil.NoSuchProcess:
+                continue
+        return {"count": len(self._children), "cpu": cpu,
+                "rss": _fmt_bytes(mem)}
+
+    def get_system_status(self):
+        ts, cached = self._sys_cache
+        if cached is not None and time.monotonic() - ts < CACHE_TTL:
+            return cached
+        info = {
+            "cpu": self.get_cpu_usage(),
+            "memory": self.get_memory_usage(),
+            "disk": self.get_disk_usage(),
+        }
+        if self._track_children:
+            info["children"] = self._sample_children()
+        self._sys_cache = (time.monotonic(), info)
+        return info
+
+    # ── UI ───────────────────────────────────────────────────────
+
+    def status(self):
+        info = self.get_system_status()
+        api = self.get_api_stats()
+        mem = info["memory"]
+        disk = info["disk"]
+        # 字典取值先落到局部变量，整块面板一次 write 写出
+        cu = info["cpu"]
+        mu, mt, mp = mem["used"], mem["total"], mem["percent"]
+        du, dt, dp = disk["used"], disk["total"], disk["percent"]
+        tc, cc, cr = api["total_calls"], api["cached_calls"], api["cache_rate"]
+        tt = api["total_tokens"]
+        # 先拼正文、用格式宽度对齐，不再手算 len() 补空格
+        rows = [
+            f"CPU:  {cu:.1f}%",
+            f"内存: {mu} / {mt} ({mp:.1f}%)",
+            f"磁盘: {du} / {dt} ({dp:.1f}%)",
+            None,
+            f"API 调用: {tc}  缓存命中: {cc} ({cr})",
+            f"累计 tokens: {tt}",
+        ]
+        rule = "╟" + "─" * 58 + "╢"
+        lines = ["╔" + "═" * 58 + "╗",
+                 f"║  {'📊 OpenClaw 资源监控':<52}║",
+                 rule]
+        lines += [rule if row is None else f"║   {row:<55}║" for row in rows]
+        lines.append("╚" + "═" * 58 + "╝")
+        sys.stdout.write("\n".join(lines) + "\n")
+
+
+def _cmd_status(monitor):
+    monitor.status()
+
+
+def _cmd_stats(monitor):
+    print(json.dumps(monitor.get_api_stats(), indent=2, ensure_ascii=False))
+
+
+def _cmd_record(monitor):
+    if len(sys.argv) < 4:
+        print("Usage: resource-monitor.py record <provider> <endpoint> "
+              "[tokens] [--cached]")
+        sys.exit(1)
+    tokens = int(sys.argv[4]) if len(sys.argv) > 4 and sys.argv[4].isdigit() else 0
+    monitor.record_api_call(sys.argv[2], sys.argv[3], tokens,
+                            cached="--cached" in sys.argv)
+    print("✅ recorded")
+
+
+COMMANDS = {
+    "status": _cmd_status,
+    "stats": _cmd_stats,
+    "record": _cmd_record,
+}
+
+
+def main():
+    cmd = sys.argv[1] if len(sys.argv) > 1 else "status"
+    handler = COMMANDS.get(cmd)
+    if handler is None:
+        print(f"Unknown command: {cmd}")
+        print(f"Usage: resource-monitor.py [{'|'.join(COMMANDS)}]")
+        sys.exit(1)
+    handler(ResourceMonitor())
+
+
+if __name__ == "__main__":
+    main()
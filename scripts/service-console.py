@@ -0,0 +1,446 @@
+#!/usr/bin/env python3
+"""
+service-console
+服务台：本机 openclaw 服务健康检查 / 启停 / 工具安装 / 推送
+
+Single entry point for poking the local services (gateway, task panel,
+cron, evolution agent), installing the scripts/ tools into ~/.local/bin,
+and pushing the workspace repo.
+"""
+
+import errno
+import json
+import os
+import random
+import select
+import shutil
+import socket
+import subprocess
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from pathlib import Path
+
+HOME = Path.home()
+TOOLS_DIR = Path(__file__).resolve().parent
+BIN_DIR = HOME / ".local" / "bin"
+WORKSPACE = HOME / ".openclaw" / "workspace"
+
+MAX_RETRIES = 3
+# 本机端口探测 100ms 绰绰有余；10s 级超时会拖死整轮健康检查
+SOCKET_TIMEOUT = 0.1
+
+GREEN = "\033[32m"
+RED = "\033[31m"
+YELLOW = "\033[33m"
+RESET = "\033[0m"
+
+# 固定标签在导入时就包好 ANSI 色，热打印路径零查表零拼接
+LABEL_RUNNING = f"{GREEN}运行中{RESET}"
+LABEL_DOWN = f"{RED}异常{RESET}"
+
+
+def color(text, code):
+    return f"{code}{text}{RESET}"
+
+
+def _retry(fn, retries=MAX_RETRIES, base=0.1, cap=2.0):
+    """统一重试策略：指数退避 + 抖动，全部失败返回 None
+
+    抖动让并发重试的各服务错开唤醒；FileNotFoundError（二进制
+    不存在）不可重试，直接快速失败。
+    """
+    for attempt in range(retries):
+        try:
+            return fn()
+        except FileNotFoundError:
+            return None
+        except Exception:
+            if attempt == retries - 1:
+                return None
+            time.sleep(min(cap, base * 2 ** attempt)
+                       * random.uniform(0.5, 1.5))
+
+
+def safe_subprocess_run(cmd, timeout=10, retries=MAX_RETRIES):
+    """带重试的 subprocess.run；全部失败返回 None"""
+    return _retry(
+        lambda: subprocess.run(cmd, capture_output=True, text=True,
+                               timeout=timeout),
+        retries=retries)
+
+
+def is_port_in_use(port, timeout=SOCKET_TIMEOUT):
+    # 非阻塞 connect + 短 select；127.0.0.1 字面量跳过域名解析
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
+        s.setblocking(False)
+        err = s.connect_ex(("127.0.0.1", port))
+        if err == 0:
+            return True
+        if err not in (errno.EINPROGRESS, errno.EWOULDBLOCK):
+            return False
+        _, writable, _ = select.select([], [s], [], timeout)
+        if not writable:
+            return False
+        return s.getsockopt(socket.SOL_SOCKET, socket.SO_ERROR) == 0
+
+
+_GATEWAY_SOCK = HOME / ".openclaw" / "gateway.sock"
+_gateway_conn = None
+
+
+def _gateway_rpc(method):
+    """走网关控制 socket 的一行 JSON RPC；连不上返回 None
+
+    连接缓存在模块全局里，一次控制台调用内的多个探针复用同一条
+    Unix socket，省掉每探针一次 fork+exec+解释器启动。
+    """
+    global _gateway_conn
+    payload = json.dumps({"method": method}).encode() + b"\n"
+    for fresh in (False, True):
+        try:
+            if _gateway_conn is None or fresh:
+                conn = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+                conn.settimeout(1.0)
+                conn.connect(str(_GATEWAY_SOCK))
+                _gateway_conn = conn
+            _gateway_conn.sendall(payload)
+            reply = _gateway_conn.makefile("rb").readline()
+            return json.loads(reply)
+        except (OSError, ValueError):
+            _gateway_conn = None
+    return None
+
+
+_probe_cache = None
+
+
+def _probe_all():
+    """一次 openclaw status --json --all 拿全部子系统状态，进程内记住
+
+    把 O(服务数) 次 fork 压成每次命令 1 次；拿不到聚合结果时返回空
+    dict，调用方回退到各自的单服务探针。
+    """
+    global _probe_cache
+    if _probe_cache is None:
+        result = safe_subprocess_run(
+            ["openclaw", "status", "--json", "--all"], retries=1)
+        data = {}
+        if result is not None and result.returncode == 0:
+            try:
+                data = json.loads(result.stdout)
+            except ValueError:
+                data = {}
+        _probe_cache = data
+    return _probe_cache
+
+
+def _gateway_check():
+    # 最快的路先试：常驻 socket > 聚合探针 > 单服务子进程
+    reply = _gateway_rpc("status")
+    if reply is not None:
+        return bool(reply.get("healthy"))
+    probe = _probe_all().get("openclaw-gateway")
+    if probe is not None:
+        return bool(probe.get("healthy"))
+    result = safe_subprocess_run(["openclaw", "gateway", "status"])
+    return result is not None and result.returncode == 0
+
+
+def _gateway_state():
+    reply = _gateway_rpc("status")
+    if reply is not None:
+        return reply.get("state", "unknown")
+    probe = _probe_all().get("openclaw-gateway")
+    if probe is not None:
+        return probe.get("state", "unknown")
+    result = safe_subprocess_run(["openclaw", "gateway", "status"])
+    if result is None:
+        return "unknown"
+    return "running" if result.returncode == 0 else "stopped"
+
+
+# 探针用的标记文件：路径对象建一次，lambda 里只剩一个 stat
+_CRONTAB = HOME / ".crontab"
+_PAUSE = HOME / ".pause-evolution"
+
+SERVICES = {
+    "openclaw-gateway": {
+        "name": "OpenClaw Gateway",
+        "check": _gateway_check,
+        "status": _gateway_state,
+        "restart": ["openclaw", "gateway", "restart"],
+    },
+    "quick-task-panel": {
+        "name": "任务面板",
+        "check": lambda: is_port_in_use(8765),
+        "status": lambda: "running" if is_port_in_use(8765) else "stopped",
+        "restart": [sys.executable, str(TOOLS_DIR / "quick-task-panel.py")],
+    },
+    "cron-scheduler": {
+        "name": "定时任务",
+        "check": lambda: _CRONTAB.exists(),
+        "status": lambda: "active" if _CRONTAB.exists() else "inactive",
+        "restart": None,
+    },
+    "evolution-agent": {
+        "name": "进化代理",
+        "check": lambda: not _PAUSE.exists(),
+        "status": lambda: "paused" if _PAUSE.exists() else "active",
+        "restart": None,
+    },
+}
+
+_print_lock = threading.Lock()
+
+# (service_id, check|status) -> (monotonic 时间戳, 值)：
+# 同一次命令里 check 和 status 往往打同一个探针，TTL 内只真跑一次
+_HC_CACHE = {}
+_HC_TTL = 1.0
+_use_cache = True
+
+
+def cached_call(service_id, kind, fn):
+    if _use_cache:
+        hit = _HC_CACHE.get((service_id, kind))
+        if hit is not None and time.monotonic() - hit[0] < _HC_TTL:
+            return hit[1]
+    value = fn()
+    _HC_CACHE[(service_id, kind)] = (time.monotonic(), value)
+    return value
+
+
+def invalidate(service_id):
+    _HC_CACHE.pop((service_id, "check"), None)
+    _HC_CACHE.pop((service_id, "status"), None)
+
+
+def get_service_status(service_id, config):
+    return {
+        "id": service_id,
+        "name": config["name"],
+        "healthy": cached_call(service_id, "check", config["check"]),
+        "state": cached_call(service_id, "status", config["status"]),
+    }
+
+
+def _run_one(service_id, config):
+    started = time.monotonic()
+    status = get_service_status(service_id, config)
+    status["latency_ms"] = round((time.monotonic() - started) * 1000, 1)
+    return status
+
+
+def health_check_detailed():
+    """并发探活：墙钟时间从各服务延迟之和降到最慢一个"""
+    results = {"checks": {}, "summary": {"healthy": 0, "unhealthy": 0}}
+    with ThreadPoolExecutor(max_workers=min(8, len(SERVICES))) as pool:
+        futures = {
+            pool.submit(_run_one, sid, cfg): sid
+            for sid, cfg in SERVICES.items()
+        }
+        for fut in as_completed(futures):
+            status = fut.result()
+            results["checks"][status["id"]] = status
+            key = "healthy" if status["healthy"] else "unhealthy"
+            results["summary"][key] += 1
+            icon = "✅" if status["healthy"] else "❌"
+            with _print_lock:
+                print(f"  {icon} {status['name']}: {status['state']} "
+                      f"({status['latency_ms']}ms)")
+    return results
+
+
+def list_services():
+    """并发取各服务状态，按注册顺序输出"""
+    with ThreadPoolExecutor(max_workers=min(8, len(SERVICES))) as pool:
+        futures = {
+            sid: pool.submit(get_service_status, sid, cfg)
+            for sid, cfg in SERVICES.items()
+        }
+        return [futures[sid].result() for sid in SERVICES]
+
+
+def print_services():
+    print("\n📋 Services\n")
+    for status in list_services():
+        label = LABEL_RUNNING if status["healthy"] else LABEL_DOWN
+        print(f"  {status['id']:<18} {label}  ({status['state']})")
+    print()
+
+
+def restart_service(service_id):
+    config = SERVICES.get(service_id)
+    if config is None:
+        print(f"❌ Unknown service: {service_id}")
+        return False
+    if config["restart"] is None:
+        print(f"⚠️  {config['name']} has no restart command")
+        return False
+
+    def _attempt():
+        result = safe_subprocess_run(config["restart"], timeout=30, retries=1)
+        if result is None or result.returncode != 0:
+            raise RuntimeError("restart failed")
+        return True
+
+    if _retry(_attempt):
+        invalidate(service_id)
+        print(f"✅ {config['name']} restarted")
+        return True
+    print(f"❌ {config['name']} restart failed")
+    return False
+
+
+def _copy_tool(source, target):
+    # Linux 的 copy_file_range 让数据在内核里搬（CoW 文件系统直接
+    # reflink，不动字节）；不可用或跨设备失败时退回普通 copyfile
+    if hasattr(os, "copy_file_range"):
+        try:
+            with open(source, "rb") as src, open(target, "wb") as dst:
+                remaining = source.stat().st_size
+                while remaining > 0:
+                    n = os.copy_file_range(src.fileno(), dst.fileno(),
+                                           remaining)
+                    if n == 0:
+                        break
+                    remaining -= n
+            return
+        except OSError:
+            pass
+    shutil.copyfile(source, target)
+
+
+def _install_one(source):
+    if source.name.startswith("_"):
+        # 下划线开头的是共享模块不是入口（record-* 都 import _taskboard）：
+        # 保留 .py 原名装进 bin，入口脚本从自身目录就能 import 到；
+        # 不是可执行文件，不给可执行位
+        target = BIN_DIR / source.name
+        _copy_tool(source, target)
+        return source.name, target
+    target = BIN_DIR / source.stem
+    _copy_tool(source, target)
+    # 只需要可执行位；copy2 那套 stat+utime 元数据保真是多余的
+    os.chmod(target, 0o755)
+    return source.name, target
+
+
+def install_all_tools():
+    """把 scripts/ 下的工具并发拷进 ~/.local/bin
+
+    各文件互不相关，线程池让读源和写目标重叠；mkdir 提到池外只做
+    一次。总耗时从各拷贝之和降到最慢一个。
+    """
+    BIN_DIR.mkdir(parents=True, exist_ok=True)
+    sources = sorted(TOOLS_DIR.glob("*.py"))
+    installed = 0
+    with ThreadPoolExecutor(max_workers=min(8, len(sources) or 1)) as pool:
+        futures = [pool.submit(_install_one, s) for s in sources]
+        for fut in as_completed(futures):
+            try:
+                name, target = fut.result()
+            except OSError as exc:
+                with _print_lock:
+                    print(f"  ❌ {exc}")
+                continue
+            with _print_lock:
+                print(f"  ✅ {name} -> {target}")
+            installed += 1
+    print(f"✅ Installed {installed} tools into {BIN_DIR}")
+
+
+def push_to_github(message="workspace sync"):
+    """工作区仓库：干净且无领先提交时直接返回，不白跑 add/commit/push
+
+    git 命令一律 retries=1——commit/push 失败重试通常只会重复失败
+    （多半需要先 rebase），不值得退避重来。
+    """
+    cwd = str(WORKSPACE)
+    status = safe_subprocess_run(
+        ["git", "-C", cwd, "status", "--porcelain=v2", "-z", "--branch"],
+        timeout=5, retries=1)
+    if status is None or status.returncode != 0:
+        print("❌ git status failed")
+        return False
+    ahead = 0
+    dirty = False
+    for entry in status.stdout.split("\0"):
+        if not entry:
+            continue
+        if entry.startswith("# branch.ab "):
+            ahead = int(entry.split()[2])  # "+A" parses as int
+        elif not entry.startswith("#"):
+            dirty = True
+            break
+    if not dirty and ahead == 0:
+        print("✅ clean and up to date, nothing to push")
+        return True
+    if dirty:
+        safe_subprocess_run(["git", "-C", cwd, "add", "-A"], retries=1)
+        safe_subprocess_run(["git", "-C", cwd, "commit", "-m", message],
+                            retries=1)
+    push = safe_subprocess_run(["git", "-C", cwd, "push"],
+                               timeout=30, retries=1)
+    ok = push is not None and push.returncode == 0
+    print("✅ pushed" if ok else "❌ push failed")
+    return ok
+
+
+def _cmd_health(_args):
+    results = health_check_detailed()
+    summary = results["summary"]
+    print(f"\n✅ {summary['healthy']} healthy, "
+          f"❌ {summary['unhealthy']} unhealthy")
+
+
+def _cmd_status(_args):
+    print_services()
+
+
+def _cmd_restart(args):
+    if not args:
+        print("Usage: service-console.py restart <service-id>")
+        sys.exit(1)
+    restart_service(args[0])
+
+
+def _cmd_install(_args):
+    install_all_tools()
+
+
+def _cmd_push(args):
+    push_to_github(args[0] if args else "workspace sync")
+
+
+def _cmd_json(_args):
+    print(json.dumps(list_services(), indent=2, ensure_ascii=False))
+
+
+COMMANDS = {
+    "status": _cmd_status,
+    "health": _cmd_health,
+    "restart": _cmd_restart,
+    "install": _cmd_install,
+    "push": _cmd_push,
+    "json": _cmd_json,
+}
+
+
+def main():
+    global _use_cache
+    if "--no-cache" in sys.argv:
+        sys.argv.remove("--no-cache")
+        _use_cache = False
+    cmd = sys.argv[1] if len(sys.argv) > 1 else "status"
+    handler = COMMANDS.get(cmd)
+    if handler is None:
+        print(f"Unknown command: {cmd}")
+        print(f"Usage: service-console.py [{'|'.join(COMMANDS)}]")
+        sys.exit(1)
+    handler(sys.argv[2:])
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,210 @@
+#!/usr/bin/env python3
+"""
+morning-briefing
+晨间简报：天气 + 任务板进度 + 每日一句，输出 HTML
+"""
+
+import asyncio
+import json
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from pathlib import Path
+
+try:
+    import urllib3
+except ImportError:  # urllib3 可选：没有就退回标准库 urllib.request
+    urllib3 = None
+    import gzip
+    import urllib.request
+
+try:
+    import aiohttp
+except ImportError:  # aiohttp 可选：没有就走线程池路径
+    aiohttp = None
+
+WORKSPACE = Path.home() / ".openclaw" / "workspace"
+TASKS_FILE = WORKSPACE / "task-board.json"
+OUTPUT_FILE = WORKSPACE / "briefing.html"
+
+CITIES = ["Shanghai"]
+
+WEATHER_URL = "https://wttr.in/{city}?format=j1"
+
+_HEADERS = {"Accept-Encoding": "gzip", "User-Agent": "openclaw-briefing/1"}
+
+if urllib3 is not None:
+    # Pooled client: keep-alive across repeat calls in one run, and gzip
+    # cuts wttr.in's ~30-60KB JSON down to a fraction on the wire
+    _http = urllib3.PoolManager(num_pools=1, headers=_HEADERS)
+
+    def _fetch(url):
+        return _http.request("GET", url, timeout=5.0).data
+else:
+    def _fetch(url):
+        # 标准库兜底：没有连接池但 gzip 照省，手动解压
+        req = urllib.request.Request(url, headers=_HEADERS)
+        with urllib.request.urlopen(req, timeout=5.0) as resp:
+            raw = resp.read()
+            if resp.headers.get("Content-Encoding") == "gzip":
+                raw = gzip.decompress(raw)
+        return raw
+
+
+def get_weather(city="Shanghai"):
+    """抓取 wttr.in 当日天气，失败返回 None"""
+    try:
+        data = json.loads(_fetch(WEATHER_URL.format(city=city)))
+        current = data["current_condition"][0]
+        return {
+            "city": city,
+            "temp": current["temp_C"],
+            "feels_like": current["FeelsLikeC"],
+            "desc": current["weatherDesc"][0]["value"],
+            "humidity": current["humidity"],
+        }
+    except Exception:
+        return None
+
+
+def get_weather_many(cities):
+    """并发抓取多城市天气，N 个城市 ~1 个 RTT 而不是 N 个"""
+    with ThreadPoolExecutor(max_workers=min(8, len(cities))) as ex:
+        return dict(zip(cities, ex.map(get_weather, cities)))
+
+
+class TaskBoard:
+    """task-board.json 的内存视图，批量更新后一次写回"""
+
+    def __init__(self, path=TASKS_FILE):
+        self.path = path
+        if path.exists():
+            self._tasks = json.loads(path.read_text(encoding="utf-8"))
+        else:
+            self._tasks = []
+        # 标题索引：值与 self._tasks 里的是同一批 dict，原地改即可
+        self._by_title = {t["title"]: t for t in self._tasks if "title" in t}
+
+    @property
+    def tasks(self):
+        return self._tasks
+
+    def update_progress(self, title, status):
+        """按标题更新任务状态，返回是否命中"""
+        task = self._by_title.get(title)
+        if task is None:
+            return False
+        task["status"] = status
+        task["updated_at"] = datetime.now().isoformat()
+        return True
+
+    def save_tasks(self, pretty=False):
+        # 热路径写紧凑 JSON（文件是机器读的）；需要人看时传 pretty=True
+        # 先在内存里编码完再一次 write，避免 json.dump 按 token 多次写
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        if pretty:
+            data = json.dumps(self._tasks, indent=2, ensure_ascii=False)
+        else:
+            data = json.dumps(self._tasks, separators=(",", ":"),
+                              ensure_ascii=False)
+        with open(self.path, "w", encoding="utf-8") as f:
+            f.write(data)
+
+
+_QUOTES = (
+    "代码是写给人看的，顺便让机器执行。",
+    "Premature optimization is the root of all evil.",
+    "先让它跑起来，再让它跑得对，最后让它跑得快。",
+    "Simplicity is prerequisite for reliability.",
+    "删掉的代码是最好的代码。",
+    "Programs must be written for people to read.",
+    "任何值得做的事都值得做好。",
+    "Talk is cheap. Show me the code.",
+)
+
+# 按年内天数预展开，取值时省掉取模和属性查找（tm_yday 最大 366）
+_QUOTE_BY_YDAY = tuple(_QUOTES[i % len(_QUOTES)] for i in range(367))
+
+
+def get_quotes():
+    """每日一句，按一年中的第几天轮换"""
+    return _QUOTE_BY_YDAY[datetime.now().timetuple().tm_yday]
+
+
+def _weather_line(weather):
+    if not weather:
+        return "天气数据暂不可用"
+    return (f"{weather['city']}: {weather['desc']} "
+            f"{weather['temp']}°C (体感 {weather['feels_like']}°C, "
+            f"湿度 {weather['humidity']}%)")
+
+
+def render_html(weather_by_city, tasks, quote):
+    today = datetime.now().strftime("%Y-%m-%d")
+    done = sum(1 for t in tasks if t.get("status") == "done")
+    weather_lines = "\n".join(
+        f"<p>🌤 {_weather_line(w)}</p>" for w in weather_by_city.values()
+    )
+    return f"""<!DOCTYPE html>
+<html lang="zh">
+<head><meta charset="utf-8"><title>晨间简报 {today}</title></head>
+<body>
+<h1>☀️ 晨间简报 — {today}</h1>
+{weather_lines}
+<p>📋 任务进度: {done}/{len(tasks)} 已完成</p>
+<blockquote>💬 {quote}</blockquote>
+</body>
+</html>
+"""
+
+
+async def get_weather_async(session, city):
+    """aiohttp 版天气抓取，失败返回 None"""
+    try:
+        async with session.get(WEATHER_URL.format(city=city), timeout=5) as r:
+            data = await r.json(content_type=None)
+        current = data["current_condition"][0]
+        return {
+            "city": city,
+            "temp": current["temp_C"],
+            "feels_like": current["FeelsLikeC"],
+            "desc": current["weatherDesc"][0]["value"],
+            "humidity": current["humidity"],
+        }
+    except Exception:
+        return None
+
+
+async def main_async():
+    """单事件循环跑完整个 IO 图：天气 + 任务读取并行，最后写 HTML"""
+    headers = {"Accept-Encoding": "gzip", "User-Agent": "openclaw-briefing/1"}
+    async with aiohttp.ClientSession(headers=headers) as session:
+        weathers, board = await asyncio.gather(
+            asyncio.gather(*(get_weather_async(session, c) for c in CITIES)),
+            asyncio.to_thread(TaskBoard),
+        )
+    weather_by_city = dict(zip(CITIES, weathers))
+    quote = get_quotes()
+
+    html = render_html(weather_by_city, board.tasks, quote)
+    OUTPUT_FILE.parent.mkdir(parents=True, exist_ok=True)
+    await asyncio.to_thread(OUTPUT_FILE.write_text, html, "utf-8")
+    print(f"✅ Briefing written to {OUTPUT_FILE}")
+
+
+def main():
+    if aiohttp is not None:
+        asyncio.run(main_async())
+        return
+
+    weather_by_city = get_weather_many(CITIES)
+    board = TaskBoard()
+    quote = get_quotes()
+
+    html = render_html(weather_by_city, board.tasks, quote)
+    OUTPUT_FILE.parent.mkdir(parents=True, exist_ok=True)
+    OUTPUT_FILE.write_text(html, encoding="utf-8")
+    print(f"✅ Briefing written to {OUTPUT_FILE}")
+
+
+if __name__ == "__main__":
+    main()